@@ -4,18 +4,301 @@ Base scraper class for WoW profession materials from wow-professions.com
 Includes rate limiting and common functionality for all profession scrapers
 """
 
+import argparse
+import asyncio
+import aiohttp
+import functools
+import hashlib
+import itertools
+import random
 import requests
+import sys
+import threading
 import time
 import re
 import json
 import os
-from bs4 import BeautifulSoup
-from typing import List, Dict, Tuple, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from email.utils import formatdate
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from typing import Callable, Iterable, List, Dict, Tuple, Optional
 from urllib.parse import urljoin
 
+try:
+    import brotli  # noqa: F401 - only probed, aiohttp does the decoding
+    _AIOHTTP_ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _AIOHTTP_ACCEPT_ENCODING = 'gzip, deflate'
+
+# Script, style and inline SVG blocks and HTML comments never hold materials, so they are
+# dropped before building the tree (BeautifulSoup node creation dominates parse time);
+# self-closed tags like <svg/> have no block to drop and are left to the parser
+_NON_CONTENT_RE = re.compile(rb'<(script|style|svg)(?=[\s/>])[^>]*(?<!/)>.*?</\1\s*>|<!--.*?-->', re.I | re.S)
+
+# Guide bodies are streamed in chunks and abandoned past a sane size to bound memory
+_CHUNK_SIZE = 64 * 1024
+_MAX_PAGE_BYTES = 10 * 1024 * 1024
+
+# Guide URL patterns used when the config has no URL for an expansion
+_FALLBACK_URL_TEMPLATES = {
+    'dragonflight': '{base}/guides/dragon-isles-{profession}-leveling-guide-dragonflight',
+    'bfa': '{base}/guides/zandalari-kul-tiran-bfa-{profession}-leveling-guide',
+    'shadowlands': '{base}/guides/{expansion}-{profession}-leveling-guide',
+}
+_DEFAULT_URL_TEMPLATE = '{base}/guides/{expansion}-{profession}-leveling'
+
+# Expansions whose guides don't have proper material sections; filtered out before any fetch
+_SKIPPED_EXPANSIONS = frozenset(['draenor', 'legion'])
+
+# Auctionator item entry: name wrapped in quotes for exact search, no expansion field
+_format_item = '"{}";{};0;0;0;0;0;0;0;0;;#;;{}'.format
+
+# Transient failures are retried with exponential backoff plus jitter, honoring Retry-After
+_MAX_RETRIES = 5
+_RETRY_BACKOFF = 1.0
+_RETRY_JITTER = 0.5
+_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# Only build the page body; head metadata is never read. Everything inside body is kept, since
+# the text fallbacks (soup.get_text(), body-wide scans) also read text outside any container
+_STRAINER = SoupStrainer('body')
+
+# Quantity patterns tried in order by the wide-net extraction; the first one is quantity-first
+_QTY_PATTERNS = [
+    re.compile(r'(\d+)x?\s*(.+)'),  # "60x Peacebloom" or "60 Peacebloom"
+    re.compile(r'(.+)\s*[x×]\s*(\d+)'),  # "Peacebloom x 60"
+    re.compile(r'(.+)\s*[-–]\s*(\d+)'),  # "Peacebloom - 60"
+    re.compile(r'(.+)\s*:\s*(\d+)'),  # "Peacebloom: 60"
+]
+# Patterns tried in order by _parse_material_text; the first two are quantity-first,
+# the name-first ones are shared with _QTY_PATTERNS
+_MATERIAL_TEXT_PATTERNS = [
+    re.compile(r'(\d+)\s*x\s*(.+)'),  # "60x Peacebloom" or "60 x Peacebloom"
+    re.compile(r'(\d+)\s+(.+)'),  # "60 Peacebloom"
+    *_QTY_PATTERNS[1:],
+]
+# Every quantity pattern needs a digit, so text without one can be skipped outright
+_DIGIT_RE = re.compile(r'\d')
+_SECTION_CLASS_RE = re.compile(r'material|shopping|ingredient|guide|content|post|article', re.I)
+_TSM_CLASS_RE = re.compile(r'tsm|tradeskill|shopping', re.I)
+# Text that makes a block after a materials heading look like a materials list
+_SECTION_HINT_RE = re.compile(r'x |ore|herb|leather|cloth|stone', re.I)
+# Materials section headings in order of preference, and the tags they may appear in
+_MATERIALS_HEADINGS = [
+    'approximate materials required',
+    'materials required',
+    'shopping list',
+    'materials needed',
+    'reagents needed'
+]
+_HEADING_TEXT_RES = [re.compile(heading_text, re.I) for heading_text in _MATERIALS_HEADINGS]
+_HEADING_RE = re.compile('|'.join(_MATERIALS_HEADINGS), re.I)
+_HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b']
+_PARENS_RE = re.compile(r'\([^)]*\)')
+_BRACKETS_RE = re.compile(r'\[[^\]]*\]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_TSM_ITEM_RE = re.compile(r'item:(\d+)/(\d+)')
+_TSM_ITEM_ID_RE = re.compile(r'item:(\d+)')
+_NAME_PUNCT_RE = re.compile(r'[^\w\s\'-]')
+_CHOICE_LINE_RE = re.compile(r'(\d+)x?\s*(.+)')
+_CHOICE_NOTE_RE = re.compile(r'\(.*?\)')
+_CHOICE_OR_RE = re.compile(r'or\s+', re.I)
+
+# Words that mark text as something other than a material name
+_SKIP_WORDS = frozenset([
+    'recipe', 'skill', 'level', 'point', 'guide', 'section',
+    'total', 'cost', 'gold', 'silver', 'copper', 'requires',
+    'choose', 'option', 'alternative', 'either', 'cheapest'
+])
+
+
+def _split_leading_quantity(text: str) -> Optional[Tuple[int, str]]:
+    """
+    Fast path for text starting with a quantity, like "60x Peacebloom" or "60 Peacebloom"
+    Gives the same result as the first quantity pattern, or None when the regex is needed
+    """
+    if not text[:1].isdecimal():
+        return None
+    end = 1
+    while end < len(text) and text[end].isdecimal():
+        end += 1
+    rest = text[end:]
+    if rest[:1] == 'x':
+        rest = rest[1:]
+    rest = rest.lstrip()
+    # Empty or multi-line remainders make the regex backtrack, so leave those to it
+    if not rest or '\n' in rest:
+        return None
+    return int(text[:end]), rest.strip()
+
+
+def _keyword_re(keywords: List[str], covered: Iterable[str] = ()) -> re.Pattern:
+    """
+    Compile a list of keywords into one alternation matching any of them as a substring
+    
+    A keyword that contains another keyword of the list, or one of the `covered` keywords of a
+    bucket checked earlier, can never decide the result on its own, so it is left out
+    
+    Args:
+        keywords: Keywords of this bucket
+        covered: Keywords of buckets that take precedence over this one
+        
+    Returns:
+        Compiled alternation of the keywords that still matter, never matching if none do
+    """
+    covered = list(covered)
+    kept = []
+    for index, keyword in enumerate(keywords):
+        if any(other in keyword for other in covered):
+            continue
+        if any(other in keyword and (other != keyword or other_index < index)
+               for other_index, other in enumerate(keywords) if other_index != index):
+            continue
+        kept.append(keyword)
+    # An empty alternation would match every name, so a bucket left without keywords never matches
+    if not kept:
+        return re.compile('(?!)')
+    return re.compile('|'.join(re.escape(keyword) for keyword in kept))
+
+
+def _bucket_re(buckets: List[re.Pattern]) -> re.Pattern:
+    """
+    Combine keyword buckets into one anchored pattern that picks the first bucket that matches
+    
+    A plain alternation of the buckets would report whichever keyword occurs first in the name,
+    so each bucket becomes a lookahead over the whole name, tried in precedence order
+    
+    Args:
+        buckets: Keyword patterns in the order they take precedence
+        
+    Returns:
+        Compiled pattern whose match has lastindex set to the 1-based index of the bucket
+    """
+    return re.compile('|'.join(f'(?=.*?(?:{bucket.pattern}))()' for bucket in buckets), re.S)
+
+
+# Categorization keywords, checked in order by _categorize_item
+_HERB_RE = _keyword_re(['leaf', 'bloom', 'blossom', 'weed', 'root', 'kelp', 'grass',
+                        'rose', 'lily', 'cap', 'moss', 'thorn', 'glory', 'vine', 'poppy',
+                        'dreamfoil', 'ragveil', 'azshara', 'veil', 'jasmine', 'whiptail', 'sansam'])
+_GEM_RE = _keyword_re(['jade', 'citrine', 'stone', 'gem', 'crystal', 'sapphire',
+                       'ruby', 'emerald', 'diamond', 'topaz'])
+_ELEMENTAL_RE = _keyword_re(['eternal', 'crystallized', 'volatile', 'rousing', 'awakened',
+                             'fire', 'air', 'water', 'earth', 'life', 'frost', 'order'])
+_POTION_RE = _keyword_re(['potion', 'elixir', 'flask', 'draught'])
+_VIAL_RE = _keyword_re(['vial'])
+
+# Keyword buckets shared by the blacksmithing, engineering and leatherworking categorizers
+_CRAFTING_ORE_RE = _keyword_re(['ore', 'metal', 'bar', 'ingot', 'copper', 'tin', 'iron',
+                                'silver', 'gold', 'mithril', 'thorium', 'adamantite',
+                                'cobalt', 'saronite', 'titanium', 'obsidium', 'elementium',
+                                'pyrite', 'ghost', 'kyparite', 'trillium', 'draenor',
+                                'leystone', 'felslate', 'storm', 'monelite', 'platinum',
+                                'laestrite', 'solenium', 'oxxein', 'phaedrum', 'sinvyr',
+                                'serevite', 'draconium', 'khaz', 'bismuth'])
+_CRAFTING_GEM_RE = _keyword_re(['jade', 'citrine', 'stone', 'gem', 'crystal', 'sapphire',
+                                'ruby', 'emerald', 'diamond', 'topaz', 'agate', 'bloodstone',
+                                'chalcedony', 'shadow', 'sun', 'huge', 'perfect'])
+_CRAFTING_LEATHER_RE = _keyword_re(['leather', 'hide', 'skin', 'scale'])
+_CRAFTING_CLOTH_RE = _keyword_re(['cloth', 'linen', 'wool', 'silk', 'mageweave', 'runecloth',
+                                  'netherweave', 'frostweave', 'embersilk', 'windwool',
+                                  'sumptuous', 'hexweave', 'shal', 'lightless', 'shrouded'])
+_CRAFTING_ELEMENTAL_RE = _keyword_re(['eternal', 'crystallized', 'volatile', 'rousing', 'awakened',
+                                      'fire', 'air', 'water', 'earth', 'life', 'frost', 'order',
+                                      'essence', 'spirit', 'primal'])
+
+# Any skip word anywhere in a name marks it as something other than a material
+_SKIP_RE = _keyword_re(sorted(_SKIP_WORDS))
+
+# Material priorities for choice selection (lower = better), checked in order by _get_material_priority
+_PRIORITY_RES = [
+    # Highly available, low-cost materials
+    (1, _keyword_re(['copper', 'tin', 'iron', 'light leather', 'medium leather',
+                     'peacebloom', 'silverleaf', 'earthroot', 'mageroyal',
+                     'linen cloth', 'wool cloth', 'rough stone', 'coarse stone',
+                     'golden sansam'])),  # Golden Sansam counts as common since it appears frequently
+    # Moderately available materials
+    (2, _keyword_re(['silver', 'gold', 'mithril', 'heavy leather', 'thick leather',
+                     'briarthorn', 'stranglekelp', 'bruiseweed', 'wild steelbloom',
+                     'silk cloth', 'mageweave cloth', 'heavy stone', 'solid stone'])),
+    # Less common, higher cost materials
+    (3, _keyword_re(['thorium', 'rugged leather', 'black lotus', 'ghost mushroom',
+                     'gromsblood', 'blindweed', 'runecloth', 'dense stone'])),
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_material_cached(name_lower: str) -> bool:
+    """Check a lowercase name against the skip words (cached, names repeat across pages)"""
+    return _SKIP_RE.search(name_lower) is None
+
+
+def _category_lookup(categories: List[Tuple[re.Pattern, str]]) -> Callable[[str], str]:
+    """
+    Build the cached categorizer for a scraper's CATEGORIES table
+    
+    Args:
+        categories: (keyword pattern, category) pairs in the order they take precedence
+        
+    Returns:
+        Function giving a lowercase name the category of its first matching bucket
+    """
+    category_re = _bucket_re([bucket for bucket, _ in categories])
+    names = tuple(category for _, category in categories)
+    
+    @functools.lru_cache(maxsize=4096)
+    def categorize(name_lower: str) -> str:
+        # Every bucket in one scan; names repeat across pages, so results are cached
+        match = category_re.match(name_lower)
+        if match:
+            return names[match.lastindex - 1]
+            
+        # Default category
+        return 'Reagents/Other'
+        
+    return categorize
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_material_priority_cached(name_lower: str) -> int:
+    """Get the choice priority of a lowercase material name (cached, names repeat across pages)"""
+    # Check priority levels
+    for priority, materials_re in _PRIORITY_RES:
+        if materials_re.search(name_lower):
+            return priority
+            
+    # Default priority for unknown materials
+    return 2
+
+
+@functools.lru_cache(maxsize=None)
+def _read_config_file(config_path: str) -> Dict:
+    """Parse the guides config once per process; every scraper instance shares the result"""
+    with open(config_path, 'rb') as f:
+        return json.load(f)
+
+
 class WowProfessionScraper:
     """Base class for scraping WoW profession leveling guides"""
     
+    # Keyword buckets used by _categorize_item, first match wins; subclasses replace the table
+    CATEGORIES = [
+        (_HERB_RE, 'Reagents/Herb'),
+        (_GEM_RE, 'Reagents/Gem'),
+        (_ELEMENTAL_RE, 'Reagents/Elemental'),
+        (_POTION_RE, 'Reagents/Potion'),
+        (_VIAL_RE, 'Reagents/Consumable'),
+    ]
+    _categorize_cached = staticmethod(_category_lookup(CATEGORIES))
+    
+    def __init_subclass__(cls, **kwargs):
+        """Compile the categorizer of subclasses that bring their own CATEGORIES table"""
+        super().__init_subclass__(**kwargs)
+        if 'CATEGORIES' in cls.__dict__:
+            cls._categorize_cached = staticmethod(_category_lookup(cls.CATEGORIES))
+            
     def __init__(self, profession: str, rate_limit: float = 2.0):
         """
         Initialize scraper for a specific profession
@@ -25,23 +308,61 @@ class WowProfessionScraper:
             rate_limit: Seconds to wait between requests (default 2.0s)
         """
         self.profession = profession
+        self.profession_title = profession.title()
         self.rate_limit = rate_limit
+        self._next_allowed = 0.0  # Monotonic time at which the next request may start
+        self._wait_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': ACCEPT_ENCODING,  # Includes br when brotli is installed
+            'Connection': 'keep-alive'
         })
         
+        # Every guide lives on one host, so keep a small pool of persistent connections
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=_MAX_RETRIES,
+                backoff_factor=_RETRY_BACKOFF,
+                backoff_jitter=_RETRY_JITTER,
+                status_forcelist=sorted(_RETRY_STATUSES),
+                respect_retry_after_header=True,
+                allowed_methods=frozenset(['GET'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        
+        # On-disk cache of fetched guide pages (set cache_dir to None or NO_CACHE=1 to disable)
+        self.cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.page_cache')
+        if os.getenv('NO_CACHE') == '1':
+            self.cache_dir = None
+        self.cache_ttl = 7 * 24 * 3600  # Guides change rarely, keep pages for a week
+        self.output_ttl = 24 * 3600  # With --reuse-output, a full shopping list younger than this is kept
+        
         # Load profession guides configuration
         self._load_config()
+        self._guide_urls = self._build_guide_url_table()
+        self._display_names = self._build_display_name_table()
+        
+    def close(self):
+        """Close the HTTP session and its pooled keep-alive connections"""
+        self.session.close()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def _load_config(self):
         """Load profession guides configuration from JSON file"""
         config_path = os.path.join(os.path.dirname(__file__), 'profession_guides_config.json')
         try:
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+            self.config = _read_config_file(config_path)
             self.BASE_URL = self.config['base_url']
-            self.EXPANSIONS = {exp: info for exp, info in self.config['expansion_info'].items()}
+            self.EXPANSIONS = dict(self.config['expansion_info'])
         except FileNotFoundError:
             print(f"Warning: Config file not found at {config_path}. Using fallback configuration.")
             # Fallback to old configuration
@@ -61,6 +382,25 @@ class WowProfessionScraper:
             }
             self.config = {'professions': {}}
     
+    def _build_display_name_table(self) -> Dict[str, str]:
+        """
+        Precompute the display name of every known expansion
+        
+        Returns:
+            Dict mapping expansion key to properly formatted expansion name
+        """
+        display_names = {}
+        for expansion, expansion_info in self.EXPANSIONS.items():
+            # Use config name if available
+            if expansion_info and 'name' in expansion_info:
+                display_names[expansion] = expansion_info['name']
+            else:
+                display_names[expansion] = expansion.replace('_', ' ').title()
+                
+        # Special case for TWW - should be all caps
+        display_names['tww'] = 'TWW'
+        return display_names
+        
     def _get_expansion_display_name(self, expansion: str) -> str:
         """
         Get the proper display name for an expansion
@@ -71,25 +411,149 @@ class WowProfessionScraper:
         Returns:
             Properly formatted expansion name
         """
-        # Special case for TWW - should be all caps
-        if expansion == 'tww':
-            return 'TWW'
-            
-        # Use config name if available
-        expansion_info = self.EXPANSIONS.get(expansion)
-        if expansion_info and 'name' in expansion_info:
-            return expansion_info['name']
+        display_name = self._display_names.get(expansion)
+        if display_name is not None:
+            return display_name
             
         # Fallback to title case
         return expansion.replace('_', ' ').title()
         
     def _wait(self):
-        """Apply rate limiting between requests"""
-        time.sleep(self.rate_limit)
+        """Apply rate limiting between requests, sleeping only for the remaining interval"""
+        with self._wait_lock:  # Threads sharing the scraper share one rate limit
+            delay = self._next_allowed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_allowed = time.monotonic() + self.rate_limit
+        
+    def _parse_html(self, content: bytes) -> BeautifulSoup:
+        """
+        Parse raw page content into a BeautifulSoup tree
+        
+        Args:
+            content: Raw HTML bytes
+            
+        Returns:
+            BeautifulSoup object of the page
+        """
+        return BeautifulSoup(_NON_CONTENT_RE.sub(b'', content), 'lxml', parse_only=_STRAINER)
+        
+    def _cache_path(self, url: str) -> str:
+        """Get the cache file path for a URL"""
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.html')
+        
+    def _read_cache(self, url: str) -> Optional[bytes]:
+        """
+        Read a cached page if it exists and has not expired
+        
+        Args:
+            url: URL of the cached page
+            
+        Returns:
+            Cached page content or None on a cache miss
+        """
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+            
+    def _write_cache(self, url: str, content: bytes, etag: Optional[str] = None):
+        """
+        Store a fetched page in the on-disk cache
+        
+        Args:
+            url: URL of the fetched page
+            content: Raw page content
+            etag: ETag header of the response, kept for revalidation
+        """
+        if not self.cache_dir:
+            return
+        path = self._cache_path(url)
+        etag_path = path[:-len('.html')] + '.etag'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            if etag:
+                with open(etag_path, 'w') as f:
+                    f.write(etag)
+            elif os.path.exists(etag_path):
+                os.remove(etag_path)
+        except OSError as e:
+            print(f"Warning: Could not cache {url}: {e}")
+            
+    def _cache_validators(self, url: str) -> Dict[str, str]:
+        """
+        Build conditional request headers for an expired cached page
+        
+        Args:
+            url: URL of the page about to be fetched
+            
+        Returns:
+            If-Modified-Since / If-None-Match headers, empty if nothing is cached
+        """
+        if not self.cache_dir:
+            return {}
+        path = self._cache_path(url)
+        try:
+            headers = {'If-Modified-Since': formatdate(os.path.getmtime(path), usegmt=True)}
+        except OSError:
+            return {}
+        try:
+            with open(path[:-len('.html')] + '.etag') as f:
+                headers['If-None-Match'] = f.read()
+        except OSError:
+            pass
+        return headers
+        
+    def _revalidate_cache(self, url: str) -> Optional[bytes]:
+        """
+        Reuse a cached page after the server answered 304 Not Modified
+        
+        Args:
+            url: URL of the cached page
+            
+        Returns:
+            Cached page content or None if it could not be read
+        """
+        path = self._cache_path(url)
+        try:
+            os.utime(path)  # Restart the cache TTL
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError as e:
+            print(f"Error fetching {url}: cached copy unavailable after 304 ({e})")
+            return None
+        
+    def _page_too_large(self, url: str, size: int) -> bool:
+        """
+        Check whether a page being streamed has exceeded the size limit
+        
+        Args:
+            url: URL being fetched
+            size: Number of body bytes received so far
+            
+        Returns:
+            True if the download should be abandoned
+        """
+        if size > _MAX_PAGE_BYTES:
+            print(f"Error fetching {url}: page is larger than {_MAX_PAGE_BYTES} bytes")
+            return True
+        return False
         
     def _get_page(self, url: str) -> Optional[BeautifulSoup]:
         """
         Fetch and parse a webpage with error handling
+        Pages are served from the on-disk cache when possible, skipping the rate limit;
+        expired cached pages are revalidated with a conditional request
         
         Args:
             url: URL to fetch
@@ -97,15 +561,123 @@ class WowProfessionScraper:
         Returns:
             BeautifulSoup object or None if failed
         """
-        try:
-            self._wait()
-            response = self.session.get(url, timeout=30)
+        content = self._read_cache(url)
+        if content is None:
+            try:
+                self._wait()
+                with self.session.get(url, timeout=30, stream=True,
+                                      headers=self._cache_validators(url)) as response:
+                    if response.status_code == 304:
+                        content = self._revalidate_cache(url)
+                        if content is None:
+                            return None
+                    else:
+                        response.raise_for_status()
+                        content = bytearray()  # One growing buffer, no list of chunks to join afterwards
+                        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                            content += chunk
+                            if self._page_too_large(url, len(content)):
+                                return None
+                        self._write_cache(url, content, response.headers.get('ETag'))
+            except requests.RequestException as e:
+                print(f"Error fetching {url}: {e}")
+                return None
+        return self._parse_html(content)
+            
+    async def _wait_async(self):
+        """Apply rate limiting between concurrent requests, shared by all tasks"""
+        async with self._async_wait_lock:
+            delay = self._next_allowed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_allowed = time.monotonic() + self.rate_limit
+            
+    async def _read_body_async(self, url: str, session: aiohttp.ClientSession) -> Optional[bytes]:
+        """
+        Download a page body in chunks and store it in the on-disk cache
+        An expired cached page is revalidated and reused on 304 Not Modified
+        
+        Args:
+            url: URL to fetch
+            session: Shared aiohttp session
+            
+        Returns:
+            Page content or None if the page is too large
+        """
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30),
+                               headers=self._cache_validators(url)) as response:
+            if response.status == 304:
+                return self._revalidate_cache(url)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml')
-        except requests.RequestException as e:
-            print(f"Error fetching {url}: {e}")
+            content = bytearray()  # One growing buffer, no list of chunks to join afterwards
+            async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                content += chunk
+                if self._page_too_large(url, len(content)):
+                    return None
+            self._write_cache(url, content, response.headers.get('ETag'))
+        return content
+        
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Decide whether a failed async request should be retried
+        
+        Args:
+            error: Error raised by the request
+            attempt: Zero-based number of the failed attempt
+            
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt >= _MAX_RETRIES:
             return None
+        if isinstance(error, aiohttp.ClientResponseError):
+            if error.status not in _RETRY_STATUSES:
+                return None
+            retry_after = (error.headers or {}).get('Retry-After', '')
+            if retry_after.isdigit():
+                return float(retry_after)
+        return _RETRY_BACKOFF * 2 ** attempt + random.uniform(0, _RETRY_JITTER)
+        
+    async def _get_page_async(self, url: str, session: aiohttp.ClientSession) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a webpage asynchronously with error handling
+        
+        Args:
+            url: URL to fetch
+            session: Shared aiohttp session
+            
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        content = self._read_cache(url)
+        if content is None:
+            for attempt in range(_MAX_RETRIES + 1):
+                try:
+                    await self._wait_async()
+                    content = await self._read_body_async(url, session)
+                    break
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    delay = self._retry_delay(e, attempt)
+                    if delay is None:
+                        print(f"Error fetching {url}: {e}")
+                        return None
+                    await asyncio.sleep(delay)
+            if content is None:
+                return None
+        # Parse in a worker thread so other fetches keep progressing on the event loop
+        return await asyncio.to_thread(self._parse_html, content)
             
+    def _build_guide_url_table(self) -> Dict[str, str]:
+        """
+        Precompute the guide URL of every expansion configured for this profession
+        
+        Returns:
+            Dict mapping expansion key to complete guide URL
+        """
+        profession_urls = self.config.get('professions', {}).get(self.profession, {})
+        return {expansion: f"{self.BASE_URL}{path}"
+                for expansion, path in profession_urls.items() if path is not None}
+        
     def _build_guide_url(self, expansion: str) -> str:
         """
         Build the URL for a specific expansion's profession guide using config file
@@ -117,24 +689,16 @@ class WowProfessionScraper:
             Complete URL to the guide
         """
         # Check if we have the profession in config
-        if self.profession in self.config.get('professions', {}):
-            profession_urls = self.config['professions'][self.profession]
-            if expansion in profession_urls and profession_urls[expansion] is not None:
-                return f"{self.BASE_URL}{profession_urls[expansion]}"
+        url = self._guide_urls.get(expansion)
+        if url is not None:
+            return url
         
         # Fallback to old URL construction if config is missing
         print(f"Warning: No config URL found for {expansion} {self.profession}, using fallback URL construction")
-        expansion_info = self.EXPANSIONS.get(expansion, {'name': expansion.title(), 'number': 0})
         
         # Try some common URL patterns as fallback
-        if expansion == 'dragonflight':
-            return f"{self.BASE_URL}/guides/dragon-isles-{self.profession}-leveling-guide-dragonflight"
-        elif expansion == 'bfa':
-            return f"{self.BASE_URL}/guides/zandalari-kul-tiran-bfa-{self.profession}-leveling-guide"
-        elif expansion in ['shadowlands']:
-            return f"{self.BASE_URL}/guides/{expansion}-{self.profession}-leveling-guide"
-        else:
-            return f"{self.BASE_URL}/guides/{expansion}-{self.profession}-leveling"
+        template = _FALLBACK_URL_TEMPLATES.get(expansion, _DEFAULT_URL_TEMPLATE)
+        return template.format(base=self.BASE_URL, expansion=expansion, profession=self.profession)
             
     def _extract_materials(self, soup: BeautifulSoup) -> List[Dict[str, any]]:
         """
@@ -147,88 +711,81 @@ class WowProfessionScraper:
         Returns:
             List of material dictionaries with keys: name, category, quantity
         """
-        materials = []
-        
         # First, look for the standard "Approximate Materials Required" section
         materials_section = self._find_materials_section(soup)
         if materials_section:
             section_materials = self._parse_materials_section(materials_section)
-            materials.extend(section_materials)
             if section_materials:  # If we found materials in the standard section, return them
-                return materials
+                return section_materials
         
-        # Look for TradeSkillMaster shopping list as fallback
-        tsm_materials = self._extract_tsm_shopping_list(soup)
-        if tsm_materials:
-            materials.extend(tsm_materials)
+        # Look for TradeSkillMaster shopping list as fallback; its fresh list collects the rest
+        materials = self._extract_tsm_shopping_list(soup)
             
         # Look for common material list patterns - cast a wide net as final fallback
-        sections = soup.find_all(['div', 'section', 'table', 'article', 'main', 'content'], 
-                                class_=re.compile(r'material|shopping|ingredient|guide|content|post|article', re.I))
+        sections = soup.find_all(['div', 'section', 'table', 'article', 'main'], class_=_SECTION_CLASS_RE)
         
         # If no specific sections found, search the entire body
         if not sections:
-            sections = [soup.find('body')] if soup.find('body') else [soup]
+            body = soup.find('body')
+            sections = [body] if body else [soup]
             
+        seen = set()  # (lowercase name, quantity) pairs already extracted from this page
         for section in sections:
             if not section:
                 continue
                 
+            full_text = section.get_text()
+                
             # Handle choice sections (like Draenor)
-            choice_materials = self._handle_choice_section(section)
+            choice_materials = self._handle_choice_section(section, full_text)
             if choice_materials:
                 materials.extend(choice_materials)
                 continue
                 
-            # Look for item lists in various elements
+            # Look for item lists in various elements, then parse all text content line by line
             items = section.find_all(['li', 'tr', 'div', 'p', 'span', 'strong', 'b'])
+            all_text_sources = itertools.chain(
+                (item.get_text(strip=True) for item in items),
+                (line.strip() for line in full_text.split('\n'))
+            )
             
-            # Also parse all text content line by line
-            full_text = section.get_text()
-            text_lines = [line.strip() for line in full_text.split('\n') if line.strip()]
-            
-            all_text_sources = []
-            for item in items:
-                item_text = item.get_text(strip=True)
-                if item_text:
-                    all_text_sources.append(item_text)
-            all_text_sources.extend(text_lines)
-            
+            seen_texts = set()  # The same text usually shows up in both sources
             for text in all_text_sources:
-                if not text or len(text) < 5:
+                if not text or len(text) < 5 or text in seen_texts:
+                    continue
+                seen_texts.add(text)
+                if not _DIGIT_RE.search(text):
                     continue
                     
-                # Try to extract quantity and item name using regex
-                patterns = [
-                    r'(\d+)x?\s*(.+)',  # "60x Peacebloom" or "60 Peacebloom"
-                    r'(.+)\s*[x×]\s*(\d+)',  # "Peacebloom x 60"
-                    r'(.+)\s*[-–]\s*(\d+)',  # "Peacebloom - 60"
-                    r'(.+)\s*:\s*(\d+)',  # "Peacebloom: 60"
-                ]
+                # Try the common "60x Peacebloom" form first, then extract quantity and item name using regex
+                parsed = _split_leading_quantity(text)
+                if parsed is None:
+                    for index, pattern in enumerate(_QTY_PATTERNS):
+                        match = pattern.search(text)
+                        if match:
+                            if index == 0:  # First pattern
+                                parsed = (int(match.group(1)), match.group(2).strip())
+                            else:  # Other patterns
+                                parsed = (int(match.group(2)), match.group(1).strip())
+                            break
+                if parsed is None:
+                    continue
+                quantity, name = parsed
                 
-                for pattern in patterns:
-                    match = re.search(pattern, text)
-                    if match:
-                        if pattern == patterns[0]:  # First pattern
-                            quantity = int(match.group(1))
-                            name = match.group(2).strip()
-                        else:  # Other patterns
-                            name = match.group(1).strip()
-                            quantity = int(match.group(2))
-                        
-                        # Clean up the name
-                        name = re.sub(r'\([^)]*\)', '', name)  # Remove parentheses
-                        name = re.sub(r'\[[^\]]*\]', '', name)  # Remove brackets
-                        name = re.sub(r'\s+', ' ', name).strip()  # Normalize whitespace
-                        
-                        # Skip if it looks like a recipe or skill level
-                        if self._is_valid_material(name):
-                            materials.append({
-                                'name': name,
-                                'category': self._categorize_item(name),
-                                'quantity': quantity
-                            })
-                        break
+                # Clean up the name
+                name = _PARENS_RE.sub('', name)  # Remove parentheses
+                name = _BRACKETS_RE.sub('', name)  # Remove brackets
+                name = _WHITESPACE_RE.sub(' ', name).strip()  # Normalize whitespace
+                
+                # Skip if it looks like a recipe or skill level, or was already extracted
+                key = (name.lower(), quantity)
+                if self._is_valid_material(name) and key not in seen:
+                    seen.add(key)
+                    materials.append({
+                        'name': name,
+                        'category': self._categorize_item(name),
+                        'quantity': quantity
+                    })
                     
         return materials
     
@@ -242,25 +799,19 @@ class WowProfessionScraper:
         Returns:
             BeautifulSoup section containing materials list or None
         """
-        # Look for common materials section headings
-        materials_headings = [
-            'approximate materials required',
-            'materials required',
-            'shopping list',
-            'materials needed',
-            'reagents needed'
-        ]
-        
-        # Find headings that might contain materials
-        for heading_text in materials_headings:
-            # Look for various heading tags
-            for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b']:
-                headings = soup.find_all(tag, string=re.compile(heading_text, re.I))
-                for heading in headings:
-                    # Find the next sibling or parent that contains the materials list
-                    section = self._find_materials_content_after_heading(heading)
-                    if section:
-                        return section
+        # Find every heading that might contain materials in one pass over the page
+        headings = soup.find_all(_HEADING_TAGS, string=_HEADING_RE)
+        
+        # Try them by heading text, then tag, then page order
+        headings.sort(key=lambda heading: (
+            next(i for i, heading_re in enumerate(_HEADING_TEXT_RES) if heading_re.search(heading.string)),
+            _HEADING_TAGS.index(heading.name)
+        ))
+        for heading in headings:
+            # Find the next sibling or parent that contains the materials list
+            section = self._find_materials_content_after_heading(heading)
+            if section:
+                return section
                         
         return None
     
@@ -282,17 +833,16 @@ class WowProfessionScraper:
                 break
                 
             # Check if this sibling contains list items or structured content
-            if current.find_all(['li', 'tr', 'div']):
+            if current.find(['li', 'tr', 'div']) is not None:
                 # Verify it contains material-like content
-                text = current.get_text().lower()
-                if any(keyword in text for keyword in ['x ', 'ore', 'herb', 'leather', 'cloth', 'stone']):
+                if _SECTION_HINT_RE.search(current.get_text()):
                     return current
                     
         # If no sibling found, try looking in the parent's next sibling
         parent = heading.find_parent()
         if parent:
             next_section = parent.find_next_sibling()
-            if next_section and next_section.find_all(['li', 'tr', 'div']):
+            if next_section and next_section.find(['li', 'tr', 'div']) is not None:
                 return next_section
                 
         return None
@@ -349,22 +899,14 @@ class WowProfessionScraper:
         Returns:
             Material dictionary or None if no valid material found
         """
-        if not text or len(text) < 5:
+        if not text or len(text) < 5 or not _DIGIT_RE.search(text):
             return None
             
         # Try to extract quantity and item name using regex
-        patterns = [
-            r'(\d+)\s*x\s*(.+)',  # "60x Peacebloom" or "60 x Peacebloom"
-            r'(\d+)\s+(.+)',      # "60 Peacebloom"
-            r'(.+)\s*[x×]\s*(\d+)',  # "Peacebloom x 60"
-            r'(.+)\s*[-–]\s*(\d+)',  # "Peacebloom - 60"
-            r'(.+)\s*:\s*(\d+)',     # "Peacebloom: 60"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for index, pattern in enumerate(_MATERIAL_TEXT_PATTERNS):
+            match = pattern.search(text)
             if match:
-                if pattern in patterns[:2]:  # First two patterns (quantity first)
+                if index < 2:  # First two patterns (quantity first)
                     quantity = int(match.group(1))
                     name = match.group(2).strip()
                 else:  # Other patterns (name first)
@@ -372,9 +914,9 @@ class WowProfessionScraper:
                     quantity = int(match.group(2))
                 
                 # Clean up the name
-                name = re.sub(r'\([^)]*\)', '', name)  # Remove parentheses
-                name = re.sub(r'\[[^\]]*\]', '', name)  # Remove brackets
-                name = re.sub(r'\s+', ' ', name).strip()  # Normalize whitespace
+                name = _PARENS_RE.sub('', name)  # Remove parentheses
+                name = _BRACKETS_RE.sub('', name)  # Remove brackets
+                name = _WHITESPACE_RE.sub(' ', name).strip()  # Normalize whitespace
                 
                 # Skip if it looks like a recipe or skill level
                 if self._is_valid_material(name) and quantity > 0:
@@ -398,69 +940,75 @@ class WowProfessionScraper:
             List of material dictionaries from TSM list
         """
         materials = []
+        page_lines = None  # Page text lines, built on the first TSM item
+        id_index = None
         
         # Look for TSM shopping list sections
         tsm_sections = soup.find_all(['div', 'section', 'pre', 'code'], 
-                                    class_=re.compile(r'tsm|tradeskill|shopping', re.I))
+                                    class_=_TSM_CLASS_RE)
         
         for section in tsm_sections:
             text = section.get_text()
             
             # Look for TSM string patterns
-            if '/tsm' in text.lower() or 'tradeskillmaster' in text.lower():
-                # Extract items from TSM string
-                lines = text.split('\n')
-                for line in lines:
-                    if '/' in line and any(char.isdigit() for char in line):
-                        # Parse TSM item strings like "item:765/50" (item ID / quantity)
-                        tsm_match = re.search(r'item:(\d+)/(\d+)', line)
-                        if tsm_match:
-                            item_id = tsm_match.group(1)
-                            quantity = int(tsm_match.group(2))
-                            
-                            # Try to find item name in the same section
-                            item_name = self._resolve_item_name(item_id, soup)
-                            if item_name:
-                                materials.append({
-                                    'name': item_name,
-                                    'category': self._categorize_item(item_name),
-                                    'quantity': quantity
-                                })
+            text_lower = text.lower()
+            if '/tsm' not in text_lower and 'tradeskillmaster' not in text_lower:
+                continue
+                
+            # Parse TSM item strings like "item:765/50" (item ID / quantity)
+            for tsm_match in _TSM_ITEM_RE.finditer(text):
+                item_id = tsm_match.group(1)
+                quantity = int(tsm_match.group(2))
+                
+                # Try to find item name near the item ID, splitting the page text only once
+                if page_lines is None:
+                    page_lines = soup.get_text().split('\n')
+                    id_index = self._index_item_ids(page_lines)
+                item_name = self._resolve_item_name(item_id, page_lines, id_index)
+                if item_name:
+                    materials.append({
+                        'name': item_name,
+                        'category': self._categorize_item(item_name),
+                        'quantity': quantity
+                    })
                                 
         return materials
         
-    def _handle_choice_section(self, section) -> List[Dict[str, any]]:
+    def _handle_choice_section(self, section, text: Optional[str] = None) -> List[Dict[str, any]]:
         """
         Handle sections with multiple material choices (like Draenor alternatives)
         Always choose the most available but historically lowest cost option
         
         Args:
             section: BeautifulSoup section containing choices
+            text: Already extracted text of the section, if the caller has it
             
         Returns:
             List of selected materials
         """
         materials = []
-        text = section.get_text().lower()
+        if text is None:
+            text = section.get_text()
+        text_lower = text.lower()
         
         # Look for choice indicators
         choice_indicators = ['choose', 'alternative', 'option', 'either', 'or', 'cheapest']
-        if not any(indicator in text for indicator in choice_indicators):
+        if not any(indicator in text_lower for indicator in choice_indicators):
             return materials
             
         # Extract all potential choices
         choices = []
-        lines = section.get_text().split('\n')
+        lines = text.split('\n')
         
         for line in lines:
-            match = re.search(r'(\d+)x?\s*(.+)', line.strip())
+            match = _CHOICE_LINE_RE.search(line.strip())
             if match:
                 quantity = int(match.group(1))
                 name = match.group(2).strip()
                 
                 # Clean up choice text
-                name = re.sub(r'\(.*?\)', '', name)  # Remove parenthetical notes
-                name = re.sub(r'or\s+', '', name, flags=re.I)  # Remove "or"
+                name = _CHOICE_NOTE_RE.sub('', name)  # Remove parenthetical notes
+                name = _CHOICE_OR_RE.sub('', name)  # Remove "or"
                 name = name.strip()
                 
                 if self._is_valid_material(name):
@@ -489,52 +1037,34 @@ class WowProfessionScraper:
         Returns:
             Priority score (lower is better)
         """
-        name_lower = item_name.lower()
-        
-        # Highly available, low-cost materials (priority 1)
-        common_materials = [
-            'copper', 'tin', 'iron', 'light leather', 'medium leather',
-            'peacebloom', 'silverleaf', 'earthroot', 'mageroyal',
-            'linen cloth', 'wool cloth', 'rough stone', 'coarse stone',
-            'golden sansam'  # Add Golden Sansam as common since it appears frequently
-        ]
-        
-        # Moderately available materials (priority 2)
-        moderate_materials = [
-            'silver', 'gold', 'mithril', 'heavy leather', 'thick leather',
-            'briarthorn', 'stranglekelp', 'bruiseweed', 'wild steelbloom',
-            'silk cloth', 'mageweave cloth', 'heavy stone', 'solid stone'
-        ]
-        
-        # Less common, higher cost materials (priority 3)
-        uncommon_materials = [
-            'thorium', 'rugged leather', 'black lotus', 'ghost mushroom',
-            'gromsblood', 'blindweed', 'runecloth', 'dense stone'
-        ]
-        
-        # Check priority levels
-        for material in common_materials:
-            if material in name_lower:
-                return 1
-                
-        for material in moderate_materials:
-            if material in name_lower:
-                return 2
-                
-        for material in uncommon_materials:
-            if material in name_lower:
-                return 3
-                
-        # Default priority for unknown materials
-        return 2
+        return _get_material_priority_cached(item_name.lower())
         
-    def _resolve_item_name(self, item_id: str, soup: BeautifulSoup) -> Optional[str]:
+    def _index_item_ids(self, lines: List[str]) -> Dict[str, List[int]]:
+        """
+        Index the TSM item IDs mentioned on a page in a single pass
+        
+        Args:
+            lines: Text lines of the page
+            
+        Returns:
+            Dict mapping item ID to the indices of the lines mentioning it
+        """
+        id_index = {}
+        for i, line in enumerate(lines):
+            for match in _TSM_ITEM_ID_RE.finditer(line):
+                indices = id_index.setdefault(match.group(1), [])
+                if not indices or indices[-1] != i:
+                    indices.append(i)
+        return id_index
+        
+    def _resolve_item_name(self, item_id: str, lines: List[str], id_index: Dict[str, List[int]]) -> Optional[str]:
         """
         Try to resolve item ID to item name from the page context
         
         Args:
             item_id: WoW item ID
-            soup: BeautifulSoup object to search for item names
+            lines: Text lines of the page
+            id_index: Item ID to line indices mapping from _index_item_ids
             
         Returns:
             Item name if found, None otherwise
@@ -542,21 +1072,16 @@ class WowProfessionScraper:
         # This is a simplified implementation
         # In a full implementation, you might query WoW API or maintain an item database
         
-        # Look for item names in the same section as the TSM string
-        text = soup.get_text()
-        lines = text.split('\n')
-        
         # Try to find lines that might contain item names near the item ID
-        for i, line in enumerate(lines):
-            if item_id in line:
-                # Check nearby lines for item names
-                for j in range(max(0, i-3), min(len(lines), i+4)):
-                    potential_name = lines[j].strip()
-                    if potential_name and not any(char.isdigit() for char in potential_name[:3]):
-                        # Clean potential name
-                        potential_name = re.sub(r'[^\w\s\'-]', '', potential_name)
-                        if len(potential_name) > 3 and len(potential_name) < 50:
-                            return potential_name
+        for i in id_index.get(item_id, []):
+            # Check nearby lines for item names
+            for j in range(max(0, i-3), min(len(lines), i+4)):
+                potential_name = lines[j].strip()
+                if potential_name and not _DIGIT_RE.search(potential_name, 0, 3):
+                    # Clean potential name
+                    potential_name = _NAME_PUNCT_RE.sub('', potential_name)
+                    if len(potential_name) > 3 and len(potential_name) < 50:
+                        return potential_name
                             
         return None
         
@@ -568,12 +1093,7 @@ class WowProfessionScraper:
             return False
             
         # Skip obvious non-materials
-        skip_words = ['recipe', 'skill', 'level', 'point', 'guide', 'section', 
-                     'total', 'cost', 'gold', 'silver', 'copper', 'requires',
-                     'choose', 'option', 'alternative', 'either', 'cheapest']
-        
-        name_lower = name.lower()
-        return not any(skip_word in name_lower for skip_word in skip_words)
+        return _is_valid_material_cached(name.lower())
         
     def _categorize_item(self, item_name: str) -> str:
         """
@@ -585,38 +1105,7 @@ class WowProfessionScraper:
         Returns:
             Category string (e.g., 'Reagents/Herb', 'Reagents/Gem')
         """
-        name_lower = item_name.lower()
-        
-        # Herb patterns
-        herb_keywords = ['leaf', 'bloom', 'blossom', 'weed', 'root', 'kelp', 'grass', 
-                        'rose', 'lily', 'cap', 'moss', 'thorn', 'glory', 'vine', 'poppy',
-                        'dreamfoil', 'ragveil', 'azshara', 'veil', 'jasmine', 'whiptail', 'sansam']  # Add specific herb names that were miscategorized
-        if any(keyword in name_lower for keyword in herb_keywords):
-            return 'Reagents/Herb'
-            
-        # Gem patterns  
-        gem_keywords = ['jade', 'citrine', 'stone', 'gem', 'crystal', 'sapphire', 
-                       'ruby', 'emerald', 'diamond', 'topaz']
-        if any(keyword in name_lower for keyword in gem_keywords):
-            return 'Reagents/Gem'
-            
-        # Elemental patterns
-        elemental_keywords = ['eternal', 'crystallized', 'volatile', 'rousing', 'awakened',
-                             'fire', 'air', 'water', 'earth', 'life', 'frost', 'order']
-        if any(keyword in name_lower for keyword in elemental_keywords):
-            return 'Reagents/Elemental'
-            
-        # Potion patterns
-        potion_keywords = ['potion', 'elixir', 'flask', 'draught']
-        if any(keyword in name_lower for keyword in potion_keywords):
-            return 'Reagents/Potion'
-            
-        # Vial patterns
-        if 'vial' in name_lower:
-            return 'Reagents/Consumable'
-            
-        # Default category
-        return 'Reagents/Other'
+        return self._categorize_cached(item_name.lower())
         
     def _format_for_auctionator(self, materials: List[Dict[str, any]], expansion_name: str, expansion_number: int) -> str:
         """
@@ -630,45 +1119,49 @@ class WowProfessionScraper:
         Returns:
             Formatted string ready for Auctionator import
         """
-        shopping_list_name = f"{expansion_name} {self.profession.title()}"
+        shopping_list_name = f"{expansion_name} {self.profession_title}"
         
         if not materials:
             return f"{shopping_list_name}\n"
             
         # Create the formatted items list
-        items = []
-        for material in materials:
-            # Wrap item name in quotes for exact search, remove expansion field entirely
-            formatted_item = f'"{material["name"]}";{material["category"]};0;0;0;0;0;0;0;0;;#;;{material["quantity"]}'
-            items.append(formatted_item)
+        items = [_format_item(material['name'], material['category'], material['quantity'])
+                 for material in materials]
             
         # Format: Shopping List Name^Item1^Item2^Item3...
         items_string = '^'.join(items)
         return f"{shopping_list_name}^{items_string}\n"
         
-    def scrape_expansion(self, expansion: str) -> str:
+    def _is_skipped_expansion(self, expansion: str) -> bool:
         """
-        Scrape materials for a specific expansion
-
+        Check whether an expansion should be excluded from scraping
+        
         Args:
             expansion: Expansion key from EXPANSIONS dict
             
         Returns:
-            Formatted materials string for Auctionator
+            True if the expansion is skipped
         """
-        # Skip problematic expansions that don't have proper material sections
-        if expansion in ['draenor', 'legion']:
+        if expansion in _SKIPPED_EXPANSIONS:
             print(f"Skipping {expansion} {self.profession} - guide structure not compatible with scraper")
-            return ""  # Return empty string to exclude from output entirely
-            
-        url = self._build_guide_url(expansion)
-        print(f"Scraping {expansion} {self.profession} from: {url}")
+            return True
+        return False
         
-        soup = self._get_page(url)
+    def _process_expansion_page(self, expansion: str, soup: Optional[BeautifulSoup]) -> str:
+        """
+        Extract and format materials from a fetched expansion guide page
+        
+        Args:
+            expansion: Expansion key from EXPANSIONS dict
+            soup: Parsed guide page, or None if the fetch failed
+            
+        Returns:
+            Formatted materials string for Auctionator
+        """
         if not soup:
             print(f"Failed to fetch page for {expansion}")
             expansion_name = self._get_expansion_display_name(expansion)
-            return f"{expansion_name} {self.profession.title()}\n"
+            return f"{expansion_name} {self.profession_title}\n"
             
         materials = self._extract_materials(soup)
         expansion_info = self.EXPANSIONS.get(expansion, {'name': expansion.title(), 'number': 0})
@@ -678,22 +1171,116 @@ class WowProfessionScraper:
         print(f"Found {len(materials)} materials for {expansion} {self.profession}")
         return self._format_for_auctionator(materials, expansion_name, expansion_number)
         
-    def scrape_all_expansions(self) -> str:
+    def _open_async_session(self) -> aiohttp.ClientSession:
         """
-        Scrape materials for all expansions
+        Create the aiohttp session shared by all fetches of one scrape
+        Must be called from inside the running event loop
+        
+        Returns:
+            aiohttp session with a keep-alive connection pool for the guide host
+        """
+        self._async_wait_lock = asyncio.Lock()
+        connector = aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=30)
+        # urllib3 may offer zstd, which aiohttp can't decode; only offer what aiohttp decodes
+        headers = dict(self.session.headers, **{'Accept-Encoding': _AIOHTTP_ACCEPT_ENCODING})
+        return aiohttp.ClientSession(connector=connector, headers=headers)
+        
+    def scrape_expansion(self, expansion: str) -> str:
+        """
+        Scrape materials for a specific expansion
+
+        Args:
+            expansion: Expansion key from EXPANSIONS dict
+            
+        Returns:
+            Formatted materials string for Auctionator
+        """
+        if self._is_skipped_expansion(expansion):
+            return ""  # Return empty string to exclude from output entirely
+            
+        url = self._build_guide_url(expansion)
+        print(f"Scraping {expansion} {self.profession} from: {url}")
+        
+        soup = self._get_page(url)
+        return self._process_expansion_page(expansion, soup)
+        
+    async def _fetch_expansion_async(self, expansion: str, session: aiohttp.ClientSession,
+                                     semaphore: asyncio.Semaphore) -> Optional[BeautifulSoup]:
+        """
+        Fetch the guide page for a specific expansion asynchronously
+        
+        Args:
+            expansion: Expansion key from EXPANSIONS dict
+            session: Shared aiohttp session
+            semaphore: Semaphore bounding the number of in-flight requests
+            
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        url = self._build_guide_url(expansion)
+        async with semaphore:
+            print(f"Scraping {expansion} {self.profession} from: {url}")
+            return await self._get_page_async(url, session)
+            
+    def _default_output_path(self) -> str:
+        """Get the default shopping list path for this profession"""
+        return f"../auctionator-shopping-lists/{self.profession}.txt"
+        
+    def _read_cached_output(self, path: str) -> Optional[str]:
+        """
+        Read a recently saved shopping list so a full scrape can be skipped
+        Only called when reuse was requested with --reuse-output
+        
+        Args:
+            path: Output path the full shopping list is saved to
+            
+        Returns:
+            Saved shopping list content, or None if it is missing or stale
+        """
+        try:
+            if os.path.getmtime(path) <= time.time() - self.output_ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except OSError:
+            return None
+        print(f"Keeping shopping list saved less than {self.output_ttl // 3600}h ago at {path}")
+        return content
+        
+    async def scrape_all_expansions_async(self) -> str:
+        """
+        Scrape materials for all expansions, fetching guide pages concurrently
         
         Returns:
             Complete formatted materials string for all expansions
         """
-        all_materials = []
+        expansions = [exp for exp in self.EXPANSIONS.keys() if not self._is_skipped_expansion(exp)]
         
-        for expansion in self.EXPANSIONS.keys():
-            expansion_materials = self.scrape_expansion(expansion)
+        # Pages are fetched concurrently; parsing stays sequential and in expansion order
+        semaphore = asyncio.Semaphore(4)
+        async with self._open_async_session() as session:
+            soups = await asyncio.gather(
+                *(self._fetch_expansion_async(expansion, session, semaphore) for expansion in expansions)
+            )
+            
+        all_materials = []
+        for expansion, soup in zip(expansions, soups):
+            expansion_materials = self._process_expansion_page(expansion, soup)
             if expansion_materials.strip():  # Only add non-empty results
                 all_materials.append(expansion_materials)
             
         return '\n'.join(all_materials)
         
+    def scrape_all_expansions(self) -> str:
+        """
+        Scrape materials for all expansions
+        Starts its own event loop, so async callers must await scrape_all_expansions_async instead
+        
+        Returns:
+            Complete formatted materials string for all expansions
+        """
+        return asyncio.run(self.scrape_all_expansions_async())
+        
     def save_to_file(self, content: str, filename: Optional[str] = None):
         """
         Save scraped materials to a file
@@ -703,18 +1290,62 @@ class WowProfessionScraper:
             filename: Output filename (defaults to ../auctionator-shopping-lists/{profession}.txt)
         """
         if filename is None:
-            filename = f"../auctionator-shopping-lists/{self.profession}.txt"
+            filename = self._default_output_path()
             
         # Ensure the directory exists
-        import os
         os.makedirs(os.path.dirname(filename), exist_ok=True)
             
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once and write the bytes directly, always with \n line endings
+        with open(filename, 'wb') as f:
+            f.write(content.encode('utf-8'))
             
         print(f"Materials saved to {filename}")
 
 
+def profession_main(scraper_class, profession: str, argv: Optional[List[str]] = None):
+    """
+    Command line entry point shared by the single-profession scraper scripts
+    
+    Args:
+        scraper_class: WowProfessionScraper subclass taking a rate_limit argument
+        profession: Profession name used in the help text and default output path
+        argv: Arguments to parse (defaults to sys.argv)
+    """
+    title = profession.title()
+    default_output = f'../auctionator-shopping-lists/{profession}.txt'
+    parser = argparse.ArgumentParser(description=f'Scrape WoW {title} materials from wow-professions.com')
+    parser.add_argument('--expansion', '-e', type=str, 
+                       help='Specific expansion to scrape (e.g., vanilla, outland, northrend)')
+    parser.add_argument('--output', '-o', type=str, default=default_output,
+                       help=f'Output filename (default: {default_output})')
+    parser.add_argument('--rate-limit', '-r', type=float, default=2.0,
+                       help='Rate limit between requests in seconds (default: 2.0)')
+    parser.add_argument('--reuse-output', action='store_true',
+                       help='Skip a full scrape if the output file was saved in the last 24 hours')
+    
+    args = parser.parse_args(argv)
+    
+    with scraper_class(rate_limit=args.rate_limit) as scraper:
+        if args.reuse_output and not args.expansion and scraper._read_cached_output(args.output) is not None:
+            return
+            
+        if args.expansion:
+            # Scrape specific expansion
+            if args.expansion not in scraper.EXPANSIONS:
+                print(f"Invalid expansion: {args.expansion}")
+                print(f"Available expansions: {', '.join(scraper.EXPANSIONS.keys())}")
+                sys.exit(1)
+                
+            content = scraper.scrape_expansion(args.expansion)
+        else:
+            # Scrape all expansions
+            print(f"Scraping all expansions for {title}...")
+            content = scraper.scrape_all_expansions()
+            
+        scraper.save_to_file(content, args.output)
+        print(f"{title} materials saved to {args.output}")
+
+
 if __name__ == "__main__":
     # Example usage
     scraper = WowProfessionScraper('alchemy')
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Debug entry point for inspecting how a guide page is scraped
+Fetches the page once and runs every requested debug stage against the same soup
+"""
+
+import sys
+import argparse
+sys.path.append('.')
+from base_scraper import WowProfessionScraper, _SKIPPED_EXPANSIONS
+from scrape_all import SCRAPERS
+
+
+def debug_method(scraper: WowProfessionScraper, expansion: str, soup):
+    """Debug the exact steps of the scrape_expansion method"""
+    print(f"\n=== DEBUG: scrape_expansion method for {expansion} ===")
+
+    # Check if expansion is being skipped
+    if expansion in _SKIPPED_EXPANSIONS:
+        print(f"❌ {expansion} would be skipped")
+    else:
+        print(f"✅ {expansion} is not in skip list")
+
+    materials = scraper._extract_materials(soup)
+    print(f"Extracted materials count: {len(materials)}")
+
+    expansion_info = scraper.EXPANSIONS.get(expansion, {'name': expansion.title(), 'number': 0})
+    expansion_name = scraper._get_expansion_display_name(expansion)
+    expansion_number = expansion_info['number']
+
+    print(f"Found {len(materials)} materials for {expansion} {scraper.profession}")
+    result = scraper._format_for_auctionator(materials, expansion_name, expansion_number)
+    print(f"Final result length: {len(result)}")
+    print(f"Result starts with: {result[:100]}...")
+
+
+def debug_section(scraper: WowProfessionScraper, expansion: str, soup):
+    """Debug materials section detection and the fallback extraction"""
+    print(f"\n=== DEBUG: {expansion} {scraper.profession_title} Materials Detection ===")
+
+    # Check if we can find the materials section
+    materials_section = scraper._find_materials_section(soup)
+    if materials_section:
+        print(f"✅ Found materials section: {materials_section.name}")
+        print(f"Section text preview: {materials_section.get_text()[:200]}...")
+
+        # Try parsing the section
+        materials = scraper._parse_materials_section(materials_section)
+        print(f"✅ Parsed {len(materials)} materials:")
+        for material in materials:
+            print(f"  - {material['name']} ({material['quantity']}) - {material['category']}")
+    else:
+        print("❌ No materials section found")
+
+        # Let's check what headings exist
+        print("\n=== Available headings ===")
+        for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            headings = soup.find_all(tag)
+            for heading in headings:
+                text = heading.get_text().strip()
+                if 'material' in text.lower() or 'required' in text.lower():
+                    print(f"{tag}: {text}")
+
+    # Try the fallback extraction method
+    print("\n=== Trying fallback extraction ===")
+    fallback_materials = scraper._extract_materials(soup)
+    print(f"Fallback found {len(fallback_materials)} materials:")
+    for material in fallback_materials:
+        print(f"  - {material['name']} ({material['quantity']}) - {material['category']}")
+
+
+def debug_full(scraper: WowProfessionScraper, expansion: str, soup):
+    """Debug the full scraping process down to the Auctionator output"""
+    print(f"\n=== DEBUG: Full {expansion} {scraper.profession_title} Scraping Process ===")
+
+    # Extract materials
+    materials = scraper._extract_materials(soup)
+    print(f"✅ Extracted {len(materials)} materials:")
+    for material in materials:
+        print(f"  - {material['name']} ({material['quantity']}) - {material['category']}")
+
+    # Get expansion info
+    expansion_info = scraper.EXPANSIONS.get(expansion, {'name': expansion.title(), 'number': 0})
+    expansion_name = scraper._get_expansion_display_name(expansion)
+    expansion_number = expansion_info['number']
+
+    print(f"Expansion name: {expansion_name}")
+    print(f"Expansion number: {expansion_number}")
+
+    # Format for auctionator
+    formatted = scraper._format_for_auctionator(materials, expansion_name, expansion_number)
+    print(f"Formatted result length: {len(formatted)}")
+    print(f"Formatted result: {formatted[:200]}..." if len(formatted) > 200 else f"Formatted result: {formatted}")
+
+
+STAGES = {
+    'method': debug_method,
+    'section': debug_section,
+    'full': debug_full
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Debug how a wow-professions.com guide page is scraped')
+    parser.add_argument('--stage', '-s', choices=list(STAGES), action='append',
+                       help='Debug stage to run, may be repeated (default: all stages)')
+    parser.add_argument('--expansion', '-e', type=str, default='shadowlands',
+                       help='Expansion to debug (default: shadowlands)')
+    parser.add_argument('--profession', '-p', type=str, default='alchemy',
+                       help='Profession to debug (default: alchemy)')
+
+    args = parser.parse_args(argv)
+
+    # Debug the profession's own scraper so its extraction and categories are the ones shown
+    if args.profession in SCRAPERS:
+        scraper = SCRAPERS[args.profession]()
+    else:
+        scraper = WowProfessionScraper(args.profession)
+        
+    with scraper:
+        url = scraper._build_guide_url(args.expansion)
+        print(f"URL: {url}")
+
+        # Fetch once; every stage works on the same parsed page
+        soup = scraper._get_page(url)
+        if not soup:
+            print("❌ Failed to get page")
+            sys.exit(1)
+        print("✅ Got page successfully")
+
+        for stage in args.stage or list(STAGES):
+            STAGES[stage](scraper, args.expansion, soup)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,108 @@ Extends the base scraper with alchemy-specific material extraction logic
 """
 
 import sys
-import argparse
-from base_scraper import WowProfessionScraper
+import functools
+import itertools
+from base_scraper import (WowProfessionScraper, profession_main, _BRACKETS_RE, _DIGIT_RE,
+                          _PARENS_RE, _QTY_PATTERNS, _WHITESPACE_RE)
 from bs4 import BeautifulSoup
 import re
 from typing import List, Dict
 
+# Quantity prefixes: "60x Peacebloom" with the x required, and with it optional
+_QTY_X_RE = re.compile(r'(\d+)x\s*(.+)')
+_QTY_RE = _QTY_PATTERNS[0]
+
+# Heading or bold text containing any of these introduces a materials list
+_MATERIAL_INDICATORS = (
+    'material', 'shopping', 'ingredient', 'required',
+    'approximate', 'needed', 'reagent', 'herb', 'components'
+)
+_MATERIAL_INDICATOR_RE = re.compile('|'.join(_MATERIAL_INDICATORS), re.I)
+
+# Words and phrases that mark text as something other than a material name
+_SKIP_WORDS = frozenset([
+    'recipe', 'skill', 'level', 'point', 'guide', 'section',
+    'total', 'cost', 'gold', 'silver', 'copper', 'requires',
+    'you should', 'prioritize', 'potions', 'that use'
+])
+_SKIP_RE = re.compile('|'.join(re.escape(word) for word in sorted(_SKIP_WORDS)), re.I)
+
+_SHOPPING_CLASS_RE = re.compile(r'shopping|material', re.I)
+_RECIPE_CLASS_RE = re.compile(r'recipe|guide', re.I)
+_RECIPE_BLOCK_CLASS_RE = re.compile(r'recipe|ingredient', re.I)
+_REQUIREMENT_LABEL_RE = re.compile(r'(requires?|materials?|ingredients?):', re.I)
+
+# Pandaria-style herb mentions: an optional quantity, with or without an "x", before a herb
+# name. Quantities with an "x" ("20 x Green Tea Leaf") are counted before bare ones ("20 Silkweed")
+_HERB_NAME = r'([A-Z][a-zA-Z\s\']+(?:Leaf|Cap|Poppy|Lily|weed))'
+_HERB_MENTION_RE = re.compile(r'(?:(\d+)\s*(?:(x)\s*)?)?' + _HERB_NAME)
+_HERB_SUFFIXES = ('leaf', 'cap', 'poppy', 'lily', 'weed')
+_PANDARIA_HERBS = ('green tea leaf', 'silkweed', 'rain poppy', 'snow lily', "fool's cap")
+# Estimated quantities for priority-list herbs with no quantity on the page
+_ESTIMATED_HERB_QUANTITIES = (
+    ('green tea leaf', 100),  # Most commonly used
+    ('silkweed', 50),
+    ('rain poppy', 30),
+    ('snow lily', 20),
+    ("fool's cap", 20)
+)
+
+# Item name cleanup patterns used by _clean_item_name, on top of the shared base_scraper ones
+_RECIPE_INFO_RE = re.compile(r'(recipe|skill|level|point).*', re.I)
+_TRAILING_X_RE = re.compile(r'x\d+$')
+_CHOICE_QTY_RE = re.compile(r'(\d+x\s*)?(.+)')
+_OR_SPLIT_RE = re.compile(r'\s+OR\s+|\s+or\s+', re.I)
+_AND_CHOICE_RE = re.compile(r'and\s+\d+x\w+.*', re.I)
+_TRAILING_CONJUNCTION_RE = re.compile(r'\s+(and|or)\s*.*', re.I)
+_TRAILING_PARENS_RE = re.compile(r'\s*\([^)]*\)\s*$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_item_name_cached(name: str) -> str:
+    """Clean up a raw alchemy item name (cached, the same raw text recurs across passes)"""
+    # Remove common unwanted patterns, skipping substitutions whose marker character is absent
+    if '(' in name:
+        name = _PARENS_RE.sub('', name)  # Remove parentheses content
+    if '[' in name:
+        name = _BRACKETS_RE.sub('', name)  # Remove brackets content
+    name = _RECIPE_INFO_RE.sub('', name)  # Remove recipe info
+    if name[-1:].isdigit():
+        name = _TRAILING_X_RE.sub('', name)  # Remove trailing x numbers
+    name_lower = name.lower()
+    
+    # Handle choice text patterns more comprehensively
+    # Look for patterns like "Golden Sansam / 14x Dreamfoil / 14x Mountain Silversage (you only need 14 from one)"
+    if '/' in name and ('only need' in name_lower or 'choose' in name_lower or 'one' in name_lower):
+        # Split on / and take the first option, clean up quantity
+        first_choice = name.split('/')[0].strip()
+        # Extract just the item name if it has quantity info
+        choice_match = _CHOICE_QTY_RE.search(first_choice)
+        if choice_match:
+            name = choice_match.group(2).strip()
+        else:
+            name = first_choice
+    
+    # Handle choice text like "and 15xAzshara's VeilOR15xNightstoneand 15xTwilight Jasmine"
+    elif 'OR' in name or ' or ' in name_lower:
+        name = _OR_SPLIT_RE.split(name)[0]
+        
+    # Remove "and XXx" patterns that indicate additional choices
+    name = _AND_CHOICE_RE.sub('', name)
+    
+    # Remove trailing conjunctions and numbers
+    name = _TRAILING_CONJUNCTION_RE.sub('', name)
+    
+    # Remove explanatory text in parentheses at the end
+    if '(' in name:
+        name = _TRAILING_PARENS_RE.sub('', name)
+    
+    name = _WHITESPACE_RE.sub(' ', name)  # Normalize whitespace
+    
+    # The same names come out of several passes; interned copies share storage and hash once
+    return sys.intern(name.strip())
+
+
 class AlchemyScraper(WowProfessionScraper):
     """Alchemy-specific scraper with enhanced material extraction"""
     
@@ -23,79 +119,76 @@ class AlchemyScraper(WowProfessionScraper):
         Extract materials from alchemy guide pages
         Enhanced for alchemy-specific patterns
         """
-        materials = []
-        
-        # First, look for the specific materials section with id="materials"
-        materials_section = soup.find('h2', id='materials')
-        if materials_section:
-            # Find the next ul element after the materials heading
-            materials_list = materials_section.find_next('ul')
-            if materials_list:
-                materials.extend(self._parse_materials_list(materials_list))
-        
-        # Also look for any other materials lists in the document
-        # Look for headings that indicate material lists
-        all_headings = soup.find_all(['h1', 'h2', 'h3'])
-        
-        for heading in all_headings:
-            heading_text_lower = heading.get_text(strip=True).lower()
-            
-            # Look for various material list indicators  
-            material_indicators = [
-                'material', 'shopping', 'ingredient', 'required', 
-                'approximate', 'needed', 'reagent', 'herb', 'components'
-            ]
-            
-            if any(indicator in heading_text_lower for indicator in material_indicators):
-                # Find the next ul after each heading
-                materials_list = heading.find_next('ul')
-                if materials_list:
-                    new_materials = self._parse_materials_list(materials_list)
-                    materials.extend(new_materials)
-        
-        # Also look for bold text that indicates materials lists (like Outland)
-        bold_elements = soup.find_all(['strong', 'b'])
+        # Materials are merged by name as each pass produces them
+        material_dict = {}
         
-        for bold in bold_elements:
-            bold_text_lower = bold.get_text(strip=True).lower()
-            
-            material_indicators = [
-                'material', 'shopping', 'ingredient', 'required', 
-                'approximate', 'needed', 'reagent', 'herb', 'components'
-            ]
-            
-            if any(indicator in bold_text_lower for indicator in material_indicators):
-                # Find the next ul after this bold text
-                materials_list = bold.find_next('ul')
-                if materials_list:
-                    new_materials = self._parse_materials_list(materials_list)
-                    materials.extend(new_materials)
+        # First, look for the specific materials section with id="materials". When its list
+        # yields materials it is authoritative, and the broader passes below are skipped
+        materials_heading = soup.find('h2', id='materials')
+        materials_list = materials_heading.find_next('ul') if materials_heading else None
+        if materials_list:
+            self._merge_materials(material_dict, self._parse_materials_list(materials_list))
+            if material_dict:
+                return list(material_dict.values())
+                
+        # Collect every element the passes below look at in a single walk over the page.
+        # Headings and bold text that introduce a list wait in `pending` until the next <ul>
+        # in document order turns up, which is the list find_next('ul') would return
+        list_headings = []
+        list_bold_elements = []
+        pending = []
+        next_list = {}
+        shopping_sections = []
+        recipe_sections = []
+        tables = []
+        for element in soup.find_all(['h1', 'h2', 'h3', 'strong', 'b', 'div', 'section', 'table', 'ul']):
+            name = element.name
+            if name == 'ul':
+                for waiting in pending:
+                    next_list[id(waiting)] = element
+                pending.clear()
+            elif name in ('h1', 'h2', 'h3', 'strong', 'b'):
+                # Look for various material list indicators
+                if _MATERIAL_INDICATOR_RE.search(element.get_text(strip=True)):
+                    (list_headings if name[0] == 'h' else list_bold_elements).append(element)
+                    pending.append(element)
+            elif name == 'table':
+                tables.append(element)
+            else:
+                classes = ' '.join(element.get('class', []))
+                if _SHOPPING_CLASS_RE.search(classes):
+                    shopping_sections.append(element)
+                if _RECIPE_CLASS_RE.search(classes):
+                    recipe_sections.append(element)
+        
+        # Several headings often lead to the same list; parse each list once so it is not counted twice
+        parsed_lists = {id(materials_list)} if materials_list else set()
+        
+        # Look for headings, then bold text (like Outland), that indicate material lists
+        for element in itertools.chain(list_headings, list_bold_elements):
+            materials_list = next_list.get(id(element))
+            if materials_list and id(materials_list) not in parsed_lists:
+                parsed_lists.add(id(materials_list))
+                self._merge_materials(material_dict, self._parse_materials_list(materials_list))
         
         # Look for shopping list sections
-        shopping_sections = soup.find_all(['div', 'section'], 
-                                        class_=re.compile(r'shopping|material', re.I))
-        
         for section in shopping_sections:
-            materials.extend(self._parse_shopping_section(section))
+            self._merge_materials(material_dict, self._parse_shopping_section(section))
                 
         # Look for recipe sections if still no materials
-        if not materials:
-            recipe_sections = soup.find_all(['div', 'section'], 
-                                          class_=re.compile(r'recipe|guide', re.I))
+        if not material_dict:
             for section in recipe_sections:
-                materials.extend(self._parse_recipe_section(section))
+                self._merge_materials(material_dict, self._parse_recipe_section(section))
                 
         # Look for table-based material lists
-        tables = soup.find_all('table')
         for table in tables:
-            materials.extend(self._parse_material_table(table))
+            self._merge_materials(material_dict, self._parse_material_table(table))
             
         # Special handling for Pandaria-style inline herb mentions
-        if not materials:
-            materials.extend(self._parse_pandaria_style(soup))
+        if not material_dict:
+            self._merge_materials(material_dict, self._parse_pandaria_style(soup))
             
-        # Deduplicate and aggregate quantities
-        return self._deduplicate_materials(materials)
+        return list(material_dict.values())
         
     def _parse_materials_list(self, materials_list) -> List[Dict[str, any]]:
         """Parse a <ul> element containing materials"""
@@ -113,7 +206,7 @@ class AlchemyScraper(WowProfessionScraper):
                 materials.extend(choice_materials)
             else:
                 # Parse the format: "60x Peacebloom"
-                match = re.search(r'(\d+)x\s*(.+)', text)
+                match = _QTY_X_RE.search(text)
                 if match:
                     quantity = int(match.group(1))
                     name = match.group(2).strip()
@@ -147,7 +240,7 @@ class AlchemyScraper(WowProfessionScraper):
         for choice in choices:
             choice = choice.strip()
             # Parse each choice: "14x Golden Sansam"
-            match = re.search(r'(\d+)x\s*(.+)', choice)
+            match = _QTY_X_RE.search(choice)
             if match:
                 quantity = int(match.group(1))
                 name = match.group(2).strip()
@@ -188,35 +281,27 @@ class AlchemyScraper(WowProfessionScraper):
         """Parse a shopping list section"""
         materials = []
         
-        # Look for list items and text content
+        # Look for list items and text content, then also parse the raw text for cases
+        # where items aren't in structured elements
         items = section.find_all(['li', 'p', 'div', 'strong', 'b'])
+        all_text_sources = itertools.chain(
+            (item.get_text(strip=True) for item in items),
+            (line.strip() for line in section.get_text().split('\n'))
+        )
         
-        # Also parse the raw text for cases where items aren't in structured elements
-        full_text = section.get_text()
-        text_lines = [line.strip() for line in full_text.split('\n') if line.strip()]
-        
-        # Combine structured items with text lines
-        all_text_sources = []
-        for item in items:
-            all_text_sources.append(item.get_text(strip=True))
-        all_text_sources.extend(text_lines)
-        
+        seen_texts = set()  # The same text usually shows up in both sources
         for text in all_text_sources:
-            if not text or len(text) < 5:
+            if not text or len(text) < 5 or text in seen_texts:
+                continue
+            seen_texts.add(text)
+            if not _DIGIT_RE.search(text):
                 continue
                 
             # Try multiple regex patterns for quantity extraction
-            patterns = [
-                r'(\d+)x?\s*(.+)',  # "60x Peacebloom" or "60 Peacebloom"
-                r'(.+)\s*[x×]\s*(\d+)',  # "Peacebloom x 60"
-                r'(.+)\s*[-–]\s*(\d+)',  # "Peacebloom - 60"
-                r'(.+)\s*:\s*(\d+)',  # "Peacebloom: 60"
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text)
+            for index, pattern in enumerate(_QTY_PATTERNS):
+                match = pattern.search(text)
                 if match:
-                    if pattern == patterns[0]:  # First pattern
+                    if index == 0:  # First pattern
                         quantity = int(match.group(1))
                         name = match.group(2).strip()
                     else:  # Other patterns
@@ -241,16 +326,16 @@ class AlchemyScraper(WowProfessionScraper):
         materials = []
         
         # Look for ingredient lists in recipes
-        recipe_blocks = section.find_all(['div', 'p'], class_=re.compile(r'recipe|ingredient', re.I))
+        recipe_blocks = section.find_all(['div', 'p'], class_=_RECIPE_BLOCK_CLASS_RE)
         
         for block in recipe_blocks:
             text = block.get_text()
             
             # Look for "Requires:" or "Materials:" patterns
-            if re.search(r'(requires?|materials?|ingredients?):', text, re.I):
+            if _REQUIREMENT_LABEL_RE.search(text):
                 lines = text.split('\n')
                 for line in lines:
-                    match = re.search(r'(\d+)x?\s*(.+)', line.strip())
+                    match = _QTY_RE.search(line.strip())
                     if match:
                         quantity = int(match.group(1))
                         name = self._clean_item_name(match.group(2))
@@ -268,14 +353,18 @@ class AlchemyScraper(WowProfessionScraper):
         """Parse material information from tables"""
         materials = []
         
-        rows = table.find_all('tr')
-        for row in rows:
-            cells = row.find_all(['td', 'th'])
+        # No cell can match a quantity if the whole table has no digit
+        if not _DIGIT_RE.search(table.get_text()):
+            return materials
+            
+        for row in table.find_all('tr'):
+            # Direct children only, so nested-table cells are left to their own rows
+            cells = [cell for cell in row.children if cell.name in ('td', 'th')]
             if len(cells) >= 2:
                 # Try to find quantity and item name in cells
-                for i, cell in enumerate(cells):
+                for cell in cells:
                     text = cell.get_text(strip=True)
-                    match = re.search(r'(\d+)x?\s*(.+)', text)
+                    match = _QTY_RE.search(text)
                     if match:
                         quantity = int(match.group(1))
                         name = self._clean_item_name(match.group(2))
@@ -296,44 +385,38 @@ class AlchemyScraper(WowProfessionScraper):
         # Get all text content
         full_text = soup.get_text()
         
-        # Look for inline herb mentions like "20 x Green Tea Leaf"
-        inline_patterns = [
-            r'(\d+)\s*x\s*([A-Z][a-zA-Z\s\']+(?:Leaf|Cap|Poppy|Lily|weed))',
-            r'(\d+)\s*([A-Z][a-zA-Z\s\']+(?:Leaf|Cap|Poppy|Lily|weed))'
-        ]
-        
-        found_herbs = {}
-        
-        for pattern in inline_patterns:
-            matches = re.finditer(pattern, full_text)
-            for match in matches:
-                quantity = int(match.group(1))
-                name = match.group(2).strip()
-                
-                # Clean up the name
-                name = self._clean_item_name(name)
-                
-                if self._is_valid_material(name) and 'herb' in name.lower() or any(suffix in name.lower() for suffix in ['leaf', 'cap', 'poppy', 'lily', 'weed']):
-                    if name in found_herbs:
-                        found_herbs[name] += quantity
-                    else:
-                        found_herbs[name] = quantity
-        
-        # Look for priority order mentions like "Green Tea Leaf > Silkweed > Rain Poppy > Snow Lily > Fool's Cap"
-        priority_pattern = r'([A-Z][a-zA-Z\s\']+(?:Leaf|Cap|Poppy|Lily|weed))\s*>\s*([A-Z][a-zA-Z\s\']+(?:Leaf|Cap|Poppy|Lily|weed))'
-        priority_matches = re.finditer(priority_pattern, full_text)
-        
-        # Extract herbs from priority list
+        # Look for inline herb mentions like "20 x Green Tea Leaf", and priority order mentions like
+        # "Green Tea Leaf > Silkweed > Rain Poppy > Snow Lily > Fool's Cap", in one pass over the text
+        x_quantities = []
+        bare_quantities = []
         priority_herbs = []
-        priority_text_matches = re.findall(r'([A-Z][a-zA-Z\s\']+(?:Leaf|Cap|Poppy|Lily|weed))', full_text)
         
-        for herb_name in priority_text_matches:
+        for match in _HERB_MENTION_RE.finditer(full_text):
+            herb_name = match.group(3)
+            quantity = match.group(1)
+            if quantity is not None:
+                (x_quantities if match.group(2) else bare_quantities).append((int(quantity), herb_name))
+                
+            # Extract herbs from priority list
             clean_name = self._clean_item_name(herb_name)
             if self._is_valid_material(clean_name) and clean_name not in priority_herbs:
                 # Add to priority herbs if it looks like a Pandaria herb
-                pandaria_herbs = ['green tea leaf', 'silkweed', 'rain poppy', 'snow lily', "fool's cap"]
-                if any(pandaria_herb in clean_name.lower() for pandaria_herb in pandaria_herbs):
+                clean_lower = clean_name.lower()
+                if any(pandaria_herb in clean_lower for pandaria_herb in _PANDARIA_HERBS):
                     priority_herbs.append(clean_name)
+                    
+        found_herbs = {}
+        
+        for quantity, name in itertools.chain(x_quantities, bare_quantities):
+            # Clean up the name
+            name = self._clean_item_name(name.strip())
+            name_lower = name.lower()
+            
+            if self._is_valid_material(name) and 'herb' in name_lower or any(suffix in name_lower for suffix in _HERB_SUFFIXES):
+                if name in found_herbs:
+                    found_herbs[name] += quantity
+                else:
+                    found_herbs[name] = quantity
         
         # Create materials from found herbs
         for name, quantity in found_herbs.items():
@@ -344,20 +427,13 @@ class AlchemyScraper(WowProfessionScraper):
             })
         
         # Add priority herbs with estimated quantities if not already found
-        estimated_quantities = {
-            'Green Tea Leaf': 100,  # Most commonly used
-            'Silkweed': 50,
-            'Rain Poppy': 30,
-            'Snow Lily': 20,
-            "Fool's Cap": 20
-        }
-        
         for herb in priority_herbs:
             if herb not in found_herbs:
                 # Estimate quantity based on herb type
                 estimated_qty = 50  # Default
-                for est_herb, qty in estimated_quantities.items():
-                    if est_herb.lower() in herb.lower():
+                herb_lower = herb.lower()
+                for est_herb, qty in _ESTIMATED_HERB_QUANTITIES:
+                    if est_herb in herb_lower:
                         estimated_qty = qty
                         break
                         
@@ -371,40 +447,7 @@ class AlchemyScraper(WowProfessionScraper):
         
     def _clean_item_name(self, name: str) -> str:
         """Clean up item names by removing unwanted text"""
-        # Remove common unwanted patterns
-        name = re.sub(r'\([^)]*\)', '', name)  # Remove parentheses content
-        name = re.sub(r'\[[^\]]*\]', '', name)  # Remove brackets content
-        name = re.sub(r'(recipe|skill|level|point).*', '', name, flags=re.I)  # Remove recipe info
-        name = re.sub(r'x\d+$', '', name)  # Remove trailing x numbers
-        
-        # Handle choice text patterns more comprehensively
-        # Look for patterns like "Golden Sansam / 14x Dreamfoil / 14x Mountain Silversage (you only need 14 from one)"
-        if '/' in name and ('only need' in name.lower() or 'choose' in name.lower() or 'one' in name.lower()):
-            # Split on / and take the first option, clean up quantity
-            first_choice = name.split('/')[0].strip()
-            # Extract just the item name if it has quantity info
-            choice_match = re.search(r'(\d+x\s*)?(.+)', first_choice)
-            if choice_match:
-                name = choice_match.group(2).strip()
-            else:
-                name = first_choice
-        
-        # Handle choice text like "and 15xAzshara's VeilOR15xNightstoneand 15xTwilight Jasmine"
-        elif 'OR' in name or ' or ' in name.lower():
-            name = re.split(r'\s+OR\s+|\s+or\s+', name, flags=re.I)[0]
-            
-        # Remove "and XXx" patterns that indicate additional choices
-        name = re.sub(r'and\s+\d+x\w+.*', '', name, flags=re.I)
-        
-        # Remove trailing conjunctions and numbers
-        name = re.sub(r'\s+(and|or)\s*.*', '', name, flags=re.I)
-        
-        # Remove explanatory text in parentheses at the end
-        name = re.sub(r'\s*\([^)]*\)\s*$', '', name)
-        
-        name = re.sub(r'\s+', ' ', name)  # Normalize whitespace
-        
-        return name.strip()
+        return _clean_item_name_cached(name)
         
     def _is_valid_material(self, name: str) -> bool:
         """Check if an item name represents a valid crafting material"""
@@ -412,61 +455,27 @@ class AlchemyScraper(WowProfessionScraper):
             return False
             
         # Skip obvious non-materials
-        skip_words = ['recipe', 'skill', 'level', 'point', 'guide', 'section', 
-                     'total', 'cost', 'gold', 'silver', 'copper', 'requires',
-                     'you should', 'prioritize', 'potions', 'that use']
-        
-        name_lower = name.lower()
-        return not any(skip_word in name_lower for skip_word in skip_words)
-        
-    def _deduplicate_materials(self, materials: List[Dict[str, any]]) -> List[Dict[str, any]]:
-        """Remove duplicates and aggregate quantities"""
-        material_dict = {}
+        return _SKIP_RE.search(name) is None
         
+    def _merge_materials(self, material_dict: Dict[str, Dict[str, any]], materials: List[Dict[str, any]]):
+        """Merge parsed materials into a name-keyed dict, aggregating quantities"""
+        # The parsed dicts are fresh and not used elsewhere, so the first one seen is updated in place
         for material in materials:
-            name = material['name']
-            if name in material_dict:
+            entry = material_dict.get(material['name'])
+            if entry is not None:
                 # Add quantities if same item appears multiple times
-                material_dict[name]['quantity'] += material['quantity']
+                entry['quantity'] += material['quantity']
             else:
-                material_dict[name] = material.copy()
-                
-        return list(material_dict.values())
+                material_dict[material['name']] = material
     
-    def scrape_expansion(self, expansion: str) -> str:
+    def _process_expansion_page(self, expansion: str, soup) -> str:
         """Override to reset chosen materials for each expansion"""
         self.chosen_materials = {}  # Reset for each expansion
-        return super().scrape_expansion(expansion)
+        return super()._process_expansion_page(expansion, soup)
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Scrape WoW Alchemy materials from wow-professions.com')
-    parser.add_argument('--expansion', '-e', type=str, 
-                       help='Specific expansion to scrape (e.g., vanilla, outland, northrend)')
-    parser.add_argument('--output', '-o', type=str, default='../auctionator-shopping-lists/alchemy.txt',
-                       help='Output filename (default: ../auctionator-shopping-lists/alchemy.txt)')
-    parser.add_argument('--rate-limit', '-r', type=float, default=2.0,
-                       help='Rate limit between requests in seconds (default: 2.0)')
-    
-    args = parser.parse_args()
-    
-    scraper = AlchemyScraper(rate_limit=args.rate_limit)
-    
-    if args.expansion:
-        # Scrape specific expansion
-        if args.expansion not in scraper.EXPANSIONS:
-            print(f"Invalid expansion: {args.expansion}")
-            print(f"Available expansions: {', '.join(scraper.EXPANSIONS.keys())}")
-            sys.exit(1)
-            
-        content = scraper.scrape_expansion(args.expansion)
-    else:
-        # Scrape all expansions
-        print("Scraping all expansions for Alchemy...")
-        content = scraper.scrape_all_expansions()
-        
-    scraper.save_to_file(content, args.output)
-    print(f"Alchemy materials saved to {args.output}")
+    profession_main(AlchemyScraper, 'alchemy')
 
 
 if __name__ == "__main__":
@@ -1,58 +1,58 @@
 #!/usr/bin/env python3
 """
 Master script to scrape all target professions
-Runs individual profession scrapers with proper rate limiting
+Runs the profession scrapers in parallel, in process, with proper rate limiting
 """
 
-import subprocess
 import sys
 import time
 import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from scrape_alchemy import AlchemyScraper
+from scrape_blacksmithing import BlacksmithingScraper
+from scrape_engineering import EngineeringScraper
+from scrape_leatherworking import LeatherworkingScraper
 
-# Target professions
-PROFESSIONS = ['alchemy', 'blacksmithing', 'engineering', 'leatherworking']
+# Target professions and their scrapers
+SCRAPERS = {
+    'alchemy': AlchemyScraper,
+    'blacksmithing': BlacksmithingScraper,
+    'engineering': EngineeringScraper,
+    'leatherworking': LeatherworkingScraper
+}
+PROFESSIONS = list(SCRAPERS)
 
-def run_profession_scraper(profession: str, expansion: str = None, rate_limit: float = 2.0):
+def run_profession_scraper(profession: str, expansion: str = None, rate_limit: float = 2.0,
+                           reuse_output: bool = False):
     """
-    Run the scraper for a specific profession
+    Run the scraper for a specific profession in this process
     
     Args:
         profession: Name of the profession to scrape
         expansion: Specific expansion (None for all)
         rate_limit: Rate limit between requests
+        reuse_output: Keep a full shopping list saved in the last 24 hours instead of scraping
     """
-    script_name = f"scrape_{profession}.py"
-    script_path = Path(__file__).parent / script_name
-    
-    if not script_path.exists():
-        print(f"Error: Scraper script {script_name} not found")
-        return False
-        
-    # Build command
-    cmd = [sys.executable, str(script_path), '--rate-limit', str(rate_limit)]
-    
-    if expansion:
-        cmd.extend(['--expansion', expansion])
-        
     print(f"Running {profession} scraper...")
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)  # 30 minute timeout
-        
-        if result.returncode == 0:
-            print(f"✓ {profession.title()} scraping completed successfully")
-            if result.stdout:
-                print(f"  Output: {result.stdout.strip()}")
-        else:
-            print(f"✗ {profession.title()} scraping failed")
-            if result.stderr:
-                print(f"  Error: {result.stderr.strip()}")
+        with SCRAPERS[profession](rate_limit=rate_limit) as scraper:
+            if expansion:
+                if expansion not in scraper.EXPANSIONS:
+                    print(f"✗ {profession.title()} scraping failed")
+                    print(f"  Error: Invalid expansion: {expansion}")
+                    return False
+                content = scraper.scrape_expansion(expansion)
+            elif reuse_output and scraper._read_cached_output(scraper._default_output_path()) is not None:
+                print(f"✓ {profession.title()} shopping list is recent, scraping skipped")
+                return True
+            else:
+                content = scraper.scrape_all_expansions()
                 
-        return result.returncode == 0
+            scraper.save_to_file(content)
+            
+        print(f"✓ {profession.title()} scraping completed successfully")
+        return True
         
-    except subprocess.TimeoutExpired:
-        print(f"✗ {profession.title()} scraping timed out")
-        return False
     except Exception as e:
         print(f"✗ {profession.title()} scraping failed: {e}")
         return False
@@ -66,7 +66,11 @@ def main():
     parser.add_argument('--rate-limit', '-r', type=float, default=2.0,
                        help='Rate limit between requests in seconds (default: 2.0)')
     parser.add_argument('--delay', '-d', type=float, default=5.0,
-                       help='Delay between profession scrapers in seconds (default: 5.0)')
+                       help='Delay between profession scraper starts in seconds (default: 5.0)')
+    parser.add_argument('--workers', '-w', type=int, default=len(PROFESSIONS),
+                       help=f'Number of profession scrapers run at once (default: {len(PROFESSIONS)})')
+    parser.add_argument('--reuse-output', action='store_true',
+                       help='Skip professions whose full shopping list was saved in the last 24 hours')
     
     args = parser.parse_args()
     
@@ -83,20 +87,30 @@ def main():
         
     print(f"Rate limit: {args.rate_limit}s between requests")
     print(f"Delay between professions: {args.delay}s")
+    print(f"Parallel scrapers: {args.workers}")
     print("-" * 50)
     
     successful = []
     failed = []
     
-    for i, profession in enumerate(professions_to_scrape):
-        # Add delay between professions (except for the first one)
-        if i > 0:
-            print(f"Waiting {args.delay}s before next profession...")
-            time.sleep(args.delay)
-            
-        success = run_profession_scraper(profession, args.expansion, args.rate_limit)
+    # Scrapers mostly wait on the network and their own rate limit, so they run side by side in threads;
+    # starts are still staggered by the delay so the site doesn't get every first request at once
+    start = time.monotonic()
+    
+    def run_staggered(i: int, profession: str) -> bool:
+        remaining = start + i * args.delay - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        return run_profession_scraper(profession, args.expansion, args.rate_limit, args.reuse_output)
+        
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = {executor.submit(run_staggered, i, profession): profession
+                   for i, profession in enumerate(professions_to_scrape)}
+        results = {futures[future]: future.result() for future in as_completed(futures)}
         
-        if success:
+    # Summaries keep the requested profession order regardless of completion order
+    for profession in professions_to_scrape:
+        if results[profession]:
             successful.append(profession)
         else:
             failed.append(profession)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Check that materials outside the usual containers, or next to stripped tags, survive page parsing
+Runs offline against inline HTML, with pytest or directly
+"""
+
+import sys
+sys.path.append('.')
+from base_scraper import WowProfessionScraper
+from scrape_blacksmithing import BlacksmithingScraper
+
+
+def test_bare_paragraph():
+    """Materials in a bare <p> under body still parse"""
+    scraper = WowProfessionScraper('alchemy')
+    soup = scraper._parse_html(b'<html><head><title>Guide</title></head>'
+                               b'<body><p>20x Rough Stone</p></body></html>')
+    materials = scraper._extract_materials(soup)
+    assert [(m['name'], m['quantity']) for m in materials] == [('Rough Stone', 20)]
+
+
+def test_text_directly_under_body():
+    """Text sitting directly under body is kept for the soup.get_text() scans"""
+    scraper = BlacksmithingScraper()
+    soup = scraper._parse_html(b'<html><body>Materials Required\n5x Rough Stone\n</body></html>')
+    assert '5x Rough Stone' in soup.get_text()
+    materials = scraper._extract_materials(soup)
+    assert ('Rough Stone', 5) in [(m['name'], m['quantity']) for m in materials]
+
+
+def test_self_closing_svg():
+    """A self-closed <svg/> does not swallow the page up to the next </svg>"""
+    scraper = WowProfessionScraper('alchemy')
+    soup = scraper._parse_html(b'<html><body><p>icon <svg class="i" viewBox="0 0 1 1"/> here</p>'
+                               b'<ul><li>20x Rough Stone</li></ul><p><svg><path/></svg></p></body></html>')
+    assert '20x Rough Stone' in soup.get_text()
+    materials = scraper._extract_materials(soup)
+    assert ('Rough Stone', 20) in [(m['name'], m['quantity']) for m in materials]
+
+
+def test_hyphenated_custom_element():
+    """Custom elements like <svg-icon> or <style-guide> are not taken for svg or style blocks"""
+    scraper = WowProfessionScraper('alchemy')
+    soup = scraper._parse_html(b'<html><body><svg-icon name="ore"></svg-icon><style-guide>'
+                               b'<ul><li>20x Rough Stone</li></ul></style-guide>'
+                               b'<svg><path/></svg><style>p {}</style></body></html>')
+    assert '20x Rough Stone' in soup.get_text()
+    materials = scraper._extract_materials(soup)
+    assert ('Rough Stone', 20) in [(m['name'], m['quantity']) for m in materials]
+
+
+if __name__ == "__main__":
+    test_bare_paragraph()
+    test_text_directly_under_body()
+    test_self_closing_svg()
+    test_hyphenated_custom_element()
+    print("✅ Bare text materials parse")